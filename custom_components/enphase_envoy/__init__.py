@@ -5,9 +5,7 @@ from datetime import timedelta
 import logging
 
 import async_timeout
-from .envoy_reader import EnvoyReader
 import httpx
-import numpy
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PASSWORD, CONF_USERNAME
@@ -20,97 +18,77 @@ from .const import (
     DOMAIN,
     NAME,
     PLATFORMS,
-    BINARY_SENSORS,
-    SENSORS,
-    PHASE_SENSORS,
     CONF_SERIAL,
     READER,
 )
+from .envoy_reader import EnvoyReader
 
 SCAN_INTERVAL = timedelta(seconds=60)
 
+# Data keys that fail the whole refresh when they cannot be read
+CRITICAL_DATA_KEYS = ("production", "envoy_info")
+
+# Refreshes a value that cannot be read keeps its last value before it is dropped
+MAX_MISSED_REFRESHES = 3
+
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Enphase Envoy from a config entry."""
-
     config = entry.data
-    name = config[CONF_NAME]
+    host, username, password, enlighten_serial, name = (
+        config[key]
+        for key in (CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SERIAL, CONF_NAME)
+    )
 
+    # The reader owns its httpx client, so the session cookies of one Envoy or
+    # Enlighten account are never sent along with the requests of another
     envoy_reader = EnvoyReader(
-        config[CONF_HOST],
-        enlighten_user=config[CONF_USERNAME],
-        enlighten_pass=config[CONF_PASSWORD],
+        host,
+        enlighten_user=username,
+        enlighten_pass=password,
         inverters=True,
-        enlighten_serial_num=config[CONF_SERIAL],
+        enlighten_serial_num=enlighten_serial,
     )
 
+    missed_refreshes = {}
+
     async def async_update_data():
         """Fetch data from API endpoint."""
-        data = {}
         async with async_timeout.timeout(120):
             try:
                 await envoy_reader.getData()
             except httpx.HTTPStatusError as err:
-                raise ConfigEntryAuthFailed from err
+                if coordinator.data is not None or not envoy_reader.get_inverters:
+                    raise ConfigEntryAuthFailed from err
+                # The inverters endpoint is fetched last and may be refused for
+                # these credentials; continue the first refresh without it
+                _LOGGER.debug("Inverter data not authorized, disabling: %s", err)
+                envoy_reader.get_inverters = False
             except httpx.HTTPError as err:
                 raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-            for description in BINARY_SENSORS:
-                if description.key == "relays":
-                    data[description.key] = await envoy_reader.relay_status()
-
-                elif description.key == "firmware":
-                    envoy_info = await envoy_reader.envoy_info()
-                    data[description.key] = envoy_info.get("update_status", None)
-
-            for description in SENSORS:
-                if description.key == "inverters":
-                    data[
-                        "inverters_production"
-                    ] = await envoy_reader.inverters_production()
-                    data["inverters_status"] = await envoy_reader.inverters_status()
-
-                elif description.key.startswith("inverters_"):
-                    continue
-
-                else:
-                    data[description.key] = await getattr(
-                        envoy_reader, description.key
-                    )()
-
-            for description in PHASE_SENSORS:
-                if description.key.startswith("production_"):
-                    data[description.key] = await envoy_reader.production_phase(
-                        description.key
-                    )
-                elif description.key.startswith("consumption_"):
-                    data[description.key] = await envoy_reader.consumption_phase(
-                        description.key
-                    )
-                elif description.key.startswith("daily_production_"):
-                    data[description.key] = await envoy_reader.daily_production_phase(
-                        description.key
-                    )
-                elif description.key.startswith("daily_consumption_"):
-                    data[description.key] = await envoy_reader.daily_consumption_phase(
-                        description.key
-                    )
-                elif description.key.startswith("lifetime_production_"):
-                    data[
-                        description.key
-                    ] = await envoy_reader.lifetime_production_phase(description.key)
-                elif description.key.startswith("lifetime_consumption_"):
-                    data[
-                        description.key
-                    ] = await envoy_reader.lifetime_consumption_phase(description.key)
-
-            data["production_power"] = await envoy_reader.production_power()
-            data["envoy_info"] = await envoy_reader.envoy_info()
-            data["inverters_info"] = await envoy_reader.inverters_info()
-
-            _LOGGER.debug("Retrieved data from API: %s", data)
+            data = await envoy_reader.get_all()
+            missing = [key for key in CRITICAL_DATA_KEYS if data.get(key) is None]
+            if missing:
+                raise UpdateFailed(f"Could not read {', '.join(missing)} from Envoy")
+
+            # Values that could not be read this cycle keep their last value
+            # for a few refreshes, then go unavailable
+            for key in data:
+                missed_refreshes.pop(key, None)
+            for key, value in (coordinator.data or {}).items():
+                if key not in data:
+                    missed_refreshes[key] = missed_refreshes.get(key, 0) + 1
+                    if missed_refreshes[key] <= MAX_MISSED_REFRESHES:
+                        data[key] = value
+
+            # The firmware sensor reads from the same envoy_info fetched above
+            data["firmware"] = data["envoy_info"].get("update_status", None)
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Retrieved %d values from API: %s", len(data), data)
 
             return data
 
@@ -124,9 +102,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     try:
         await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryAuthFailed:
-        envoy_reader.get_inverters = False
-        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await envoy_reader.aclose()
+        raise
 
     if not entry.unique_id:
         try:
@@ -151,5 +129,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data[READER].aclose()
     return unload_ok
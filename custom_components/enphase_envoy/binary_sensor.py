@@ -22,7 +22,7 @@ async def async_setup_entry(
     for sensor_description in BINARY_SENSORS:
         if sensor_description.key.startswith ("inverters_"):
             if coordinator.data.get ("inverters_status") is not None:
-                for inverter in coordinator.data ["inverters_status"].keys ():
+                for inverter in coordinator.data ["inverters_status"]:
                     device_name = f"Inverter {inverter}"
                     entity_name = f"{device_name} {sensor_description.name}"
                     entities.append (
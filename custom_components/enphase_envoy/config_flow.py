@@ -5,7 +5,6 @@ import contextlib
 import logging
 from typing import Any
 
-from .envoy_reader import EnvoyReader
 import httpx
 import voluptuous as vol
 
@@ -17,6 +16,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import DOMAIN, CONF_SERIAL
+from .envoy_reader import EnvoyReader
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,12 +33,17 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> EnvoyRead
         enlighten_serial_num=data[CONF_SERIAL],
     )
 
+    # The reader owns its client, so the session cookies stay out of the
+    # httpx client Home Assistant shares between integrations
     try:
         await envoy_reader.getData()
-    except httpx.HTTPStatusError as err:
-        raise InvalidAuth from err
-    except (RuntimeError, httpx.HTTPError) as err:
-        raise CannotConnect from err
+    except Exception as err:
+        await envoy_reader.aclose()
+        if isinstance(err, httpx.HTTPStatusError):
+            raise InvalidAuth from err
+        if isinstance(err, (RuntimeError, httpx.HTTPError)):
+            raise CannotConnect from err
+        raise
 
     return envoy_reader
 
@@ -151,6 +156,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
+                # the reader is only needed to read the serial number
+                try:
+                    if not self._reauth_entry and not self.unique_id:
+                        await self._async_set_unique_id_from_envoy(envoy_reader)
+                finally:
+                    await envoy_reader.aclose()
+
                 data = user_input.copy()
                 data[CONF_NAME] = self._async_envoy_name()
 
@@ -161,11 +173,6 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     )
                     return self.async_abort(reason="reauth_successful")
 
-                if not self.unique_id and await self._async_set_unique_id_from_envoy(
-                    envoy_reader
-                ):
-                    data[CONF_NAME] = self._async_envoy_name()
-
                 if self.unique_id:
                     self._abort_if_unique_id_configured({CONF_HOST: data[CONF_HOST]})
 
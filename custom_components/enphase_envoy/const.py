@@ -126,6 +126,15 @@ SENSORS = (
     ),
 )
 
+# SENSORS grouped by the coordinator data they are created from
+INVERTER_SENSORS = tuple(sensor for sensor in SENSORS if sensor.key == "inverters")
+INVERTER_STATUS_SENSORS = tuple(
+    sensor for sensor in SENSORS if sensor.key.startswith("inverters_")
+)
+DEVICE_SENSORS = tuple(
+    sensor for sensor in SENSORS if not sensor.key.startswith("inverters")
+)
+
 PHASE_SENSORS = (
     SensorEntityDescription(
         key="production_l1",
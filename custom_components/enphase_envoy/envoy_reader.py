@@ -1,5 +1,4 @@
 """Module to read production and consumption values from an Enphase Envoy on the local network."""
-import argparse
 import asyncio
 import datetime
 import time
@@ -8,13 +7,18 @@ import jwt
 import xmltodict
 import httpx
 import re
+from itertools import chain
+from operator import itemgetter
 from json.decoder import JSONDecodeError
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
-from bs4 import BeautifulSoup
-from envoy_utils.envoy_utils import EnvoyUtils
 
-SERIAL_REGEX = re.compile(r"Envoy\s*Serial\s*Number:\s*([0-9]+)")
+SERIAL_XML_REGEX = re.compile(rb"<sn>([^<]*)</sn>")
+SERIAL_REGEX = re.compile(rb"Envoy\s*Serial\s*Number:\s*([0-9]+)")
 
 ENDPOINT_URL_INVENTORY = "https://{}/inventory.json"
 ENDPOINT_URL_PRODUCTION_JSON = "https://{}/production.json?details=1"
@@ -28,6 +32,76 @@ ENDPOINT_URL_DEVSTATUS = "https://{}/ivp/peb/devstatus"
 ENDPOINT_URL_PRODUCTION_POWER = "https://{}/ivp/mod/603980032/mode/power"
 ENDPOINT_URL_INFO_XML = "https://{}/info.xml"
 
+# URL of every endpoint, keyed by the EnvoyReader attribute storing its response
+ENDPOINT_URLS = {
+    "endpoint_production_json_results": ENDPOINT_URL_PRODUCTION_JSON,
+    "endpoint_production_v1_results": ENDPOINT_URL_PRODUCTION_V1,
+    "endpoint_production_inverters": ENDPOINT_URL_PRODUCTION_INVERTERS,
+    "endpoint_ensemble_json_results": ENDPOINT_URL_ENSEMBLE_INVENTORY,
+    "endpoint_home_json_results": ENDPOINT_URL_HOME_JSON,
+    "endpoint_devstatus": ENDPOINT_URL_DEVSTATUS,
+    "endpoint_production_power": ENDPOINT_URL_PRODUCTION_POWER,
+    "endpoint_info_results": ENDPOINT_URL_INFO_XML,
+    "endpoint_inventory_results": ENDPOINT_URL_INVENTORY,
+    "check_jwt": ENDPOINT_URL_CHECK_JWT,
+}
+
+# Values returned by get_all(), as (key, EnvoyReader method) pairs
+VALUE_READERS = (
+    ("production", "production"),
+    ("daily_production", "daily_production"),
+    ("seven_days_production", "seven_days_production"),
+    ("lifetime_production", "lifetime_production"),
+    ("consumption", "consumption"),
+    ("daily_consumption", "daily_consumption"),
+    ("seven_days_consumption", "seven_days_consumption"),
+    ("lifetime_consumption", "lifetime_consumption"),
+    ("inverters_production", "inverters_production"),
+    ("inverters_status", "inverters_status"),
+    ("relays", "relay_status"),
+    ("production_power", "production_power"),
+    ("envoy_info", "envoy_info"),
+    ("inverters_info", "inverters_info"),
+)
+
+# Index into a meter's "lines" list for every per phase value key
+PHASE_INDEX = {
+    f"{prefix}_l{line + 1}": line
+    for prefix in (
+        "production",
+        "consumption",
+        "daily_production",
+        "daily_consumption",
+        "lifetime_production",
+        "lifetime_consumption",
+    )
+    for line in range(3)
+}
+
+# Per phase values returned by get_all(); the method takes the key as argument
+PHASE_VALUE_READERS = tuple((key, f"{key[:-3]}_phase") for key in PHASE_INDEX)
+
+# Meter totals read by EnvoyReader.snapshot(), as (key prefix, production.json
+# field, api/v1/production field) tuples
+METER_FIELDS = (
+    ("", "wNow", "wattsNow"),
+    ("daily_", "whToday", "wattHoursToday"),
+    ("seven_days_", "whLastSevenDays", "wattHoursSevenDays"),
+    ("lifetime_", "whLifetime", "wattHoursLifetime"),
+)
+
+# Seconds a successful response of a slowly changing endpoint is reused
+# before it is fetched again; other endpoints are fetched on every update
+ENDPOINT_TTL = {
+    "endpoint_ensemble_json_results": 300,
+    "endpoint_home_json_results": 300,
+    "endpoint_info_results": 3600,
+    "endpoint_inventory_results": 300,
+}
+
+# Delay before the first retry of a failed request, doubled for every retry
+RETRY_BACKOFF_SECONDS = 0.2
+
 ENVOY_MODEL_S = "PC"
 ENVOY_MODEL_C = "P"
 
@@ -48,8 +122,92 @@ def has_metering_setup(json):
     return json["production"][1]["activeCount"] > 0
 
 
-class SwitchToHTTPS(Exception):
-    pass
+def _read_meter(values, key, meter, field):
+    """Store a meter field under key, and per phase if the meter has lines."""
+    if not isinstance(meter, dict):
+        return
+    try:
+        values[key] = int(meter[field])
+    except (KeyError, TypeError, ValueError):
+        pass
+    lines = meter.get("lines")
+    if f"{key}_l1" not in PHASE_INDEX or not isinstance(lines, list):
+        return
+    for line, line_meter in enumerate(lines[:3], 1):
+        try:
+            values[f"{key}_l{line}"] = int(line_meter[field])
+        except (KeyError, TypeError, ValueError):
+            pass
+
+
+def _report_date(timestamp):
+    """Format a report timestamp as local "YYYY-MM-DD HH:MM:SS" time."""
+    return datetime.datetime.fromtimestamp(timestamp).isoformat(
+        sep=" ", timespec="seconds"
+    )
+
+
+def _field_index(table):
+    """Map the field names of a devstatus table to their column index."""
+    return {field: i for i, field in enumerate(table["fields"])}
+
+
+def _from_milli(value):
+    """Convert a milli unit devstatus value to its base unit."""
+    if isinstance(value, (int, float)):
+        return value / 1000
+    # numeric strings still convert, as they did through int()
+    return int(value) / 1000
+
+
+def _unchanged(value):
+    """Return a devstatus value as is."""
+    return value
+
+
+# devstatus pcu fields read per inverter, as field: (key, transform) pairs
+INVERTER_PCU_FIELDS = {
+    "communicating": ("communicating", _unchanged),
+    "producing": ("producing", _unchanged),
+    "reportDate": ("report_date", _report_date),
+    "temperature": ("temperature", _unchanged),
+    "dcVoltageINmV": ("dc_voltage", _from_milli),
+    "dcCurrentINmA": ("dc_current", _from_milli),
+    "acVoltageINmV": ("ac_voltage", _from_milli),
+    "acPowerINmW": ("ac_power", _from_milli),
+}
+
+# devstatus pcu fields read per relay
+RELAY_PCU_FIELDS = {
+    field: INVERTER_PCU_FIELDS[field] for field in ("communicating", "reportDate")
+}
+
+# devstatus nsrb fields read per relay
+RELAY_NSRB_FIELDS = {
+    field: (field, _unchanged) for field in ("relay", "forced", "reason_code", "reason")
+}
+
+# errors a devstatus field transform raises on a bad cell, skipping the row
+ROW_ERRORS = (TypeError, ValueError, OverflowError, OSError)
+
+
+def _row_reader(index, fields):
+    """Return a function reading the fields present in a table from a row."""
+    present = [field for field in fields if field in index]
+    outputs = [fields[field] for field in present]
+    if not present:
+        return lambda row: {}
+    if len(present) == 1:
+        # itemgetter with a single column returns the value, not a tuple
+        ((key, transform),) = outputs
+        column = index[present[0]]
+        return lambda row: {key: transform(row[column])}
+
+    get_values = itemgetter(*(index[field] for field in present))
+    return lambda row: {
+        key: transform(value)
+        for (key, transform), value in zip(outputs, get_values(row))
+    }
 
 
 class EnvoyReader:
@@ -72,6 +230,9 @@ class EnvoyReader:
     ):
         """Init the EnvoyReader."""
         self.host = host.lower()
+        self._urls = {
+            key: url.format(self.host) for key, url in ENDPOINT_URLS.items()
+        }
         self.get_inverters = inverters
         self.endpoint_type = None
         self.serial_number_last_six = None
@@ -86,126 +247,184 @@ class EnvoyReader:
         self.endpoint_info_results = None
         self.endpoint_inventory_results = None
         self.isMeteringEnabled = False
+        self._json_cache = {}
+        self._snapshot = None
+        self._endpoint_fetched_at = {}
+        self._pcu_status = None
+        self._unreadable_keys = set()
         self._async_client = async_client
+        self._owns_client = async_client is None
         self._authorization_header = None
-        self._cookies = None
         self.enlighten_user = enlighten_user
         self.enlighten_pass = enlighten_pass
         self.commissioned = commissioned
         self.enlighten_serial_num = enlighten_serial_num
         self._token = ""
+        self._token_exp = 0
+        self._token_refresh_at = 0
+        self._token_refresh_lock = asyncio.Lock()
+        self._token_refreshed_at = 0.0
         self.token_refresh_buffer_seconds = token_refresh_buffer_seconds
 
     @property
     def async_client(self):
-        """Return the httpx client."""
-        return self._async_client or httpx.AsyncClient(verify=False)
+        """Return the httpx client, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                verify=False,
+                limits=httpx.Limits(
+                    max_keepalive_connections=4,
+                    max_connections=8,
+                    keepalive_expiry=75.0,
+                ),
+                timeout=httpx.Timeout(30.0),
+            )
+        return self._async_client
+
+    async def aclose(self):
+        """Close the httpx client if it was created by this reader."""
+        if self._owns_client and self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
 
     async def _update(self):
         """Update the data."""
+        updates = [self._update_from_installer_endpoint(), self._update_device_info()]
         if self.endpoint_type == ENVOY_MODEL_S:
-            await self._update_from_pc_endpoint()
+            updates.append(self._update_from_pc_endpoint())
         if self.endpoint_type == ENVOY_MODEL_C or (
             self.endpoint_type == ENVOY_MODEL_S and not self.isMeteringEnabled
         ):
-            await self._update_from_p_endpoint()
+            updates.append(self._update_from_p_endpoint())
+
+        await asyncio.gather(*updates)
 
-        await self._update_from_installer_endpoint()
-        await self._update_endpoint("endpoint_info_results", ENDPOINT_URL_INFO_XML)
-        await self._update_endpoint(
-            "endpoint_inventory_results", ENDPOINT_URL_INVENTORY
+    async def _update_device_info(self):
+        """Update the Envoy and inverter device information."""
+        await asyncio.gather(
+            self._update_endpoint("endpoint_info_results"),
+            self._update_endpoint("endpoint_inventory_results"),
         )
 
     async def _update_from_pc_endpoint(self):
         """Update from PC endpoint."""
-        await self._update_endpoint(
-            "endpoint_production_json_results", ENDPOINT_URL_PRODUCTION_JSON
+        await asyncio.gather(
+            self._update_endpoint("endpoint_production_json_results"),
+            self._update_pc_details(),
         )
-        await self._update_endpoint(
-            "endpoint_ensemble_json_results", ENDPOINT_URL_ENSEMBLE_INVENTORY
-        )
-        await self._update_endpoint(
-            "endpoint_home_json_results", ENDPOINT_URL_HOME_JSON
+
+    async def _update_pc_details(self):
+        """Update the ensemble inventory and home endpoints of an Envoy S."""
+        await asyncio.gather(
+            self._update_endpoint("endpoint_ensemble_json_results"),
+            self._update_endpoint("endpoint_home_json_results"),
         )
 
     async def _update_from_p_endpoint(self):
         """Update from P endpoint."""
-        await self._update_endpoint(
-            "endpoint_production_v1_results", ENDPOINT_URL_PRODUCTION_V1
-        )
+        await self._update_endpoint("endpoint_production_v1_results")
 
     async def _update_from_installer_endpoint(self):
         """Update from installer endpoint."""
-        await self._update_endpoint(
-            "endpoint_devstatus", ENDPOINT_URL_DEVSTATUS,
-        )
-        await self._update_endpoint(
-            "endpoint_production_power",
-            ENDPOINT_URL_PRODUCTION_POWER,
+        await asyncio.gather(
+            self._update_endpoint("endpoint_devstatus"),
+            self._update_endpoint("endpoint_production_power"),
         )
 
-    async def _update_endpoint(self, attr, url, only_on_success=False):
-        """Update a property from an endpoint."""
-        formatted_url = url.format(self.host)
+    async def _update_endpoint(self, attr, only_on_success=False):
+        """Update a property from an endpoint.
+
+        Endpoints listed in ENDPOINT_TTL keep a successful response until
+        their TTL has passed."""
+        ttl = ENDPOINT_TTL.get(attr)
+        fetched_at = self._endpoint_fetched_at.get(attr)
+        if ttl and fetched_at is not None and time.monotonic() - fetched_at < ttl:
+            return
+
         response = await self._async_fetch_with_retry(
-            formatted_url, follow_redirects=False
+            self._urls[attr], follow_redirects=False
         )
         if not only_on_success or response.status_code == 200:
             setattr(self, attr, response)
+            self._json_cache.pop(attr, None)
+            self._snapshot = None
+        if ttl and response is not None and response.status_code == 200:
+            self._endpoint_fetched_at[attr] = time.monotonic()
+
+    def _endpoint_json(self, attr):
+        """Return the decoded JSON of a stored endpoint response.
+
+        The body is decoded once per fetched response, straight from its
+        bytes, and reused by every accessor reading the same endpoint."""
+        if attr not in self._json_cache:
+            self._json_cache[attr] = _json.loads(getattr(self, attr).content)
+        return self._json_cache[attr]
 
     async def _async_fetch_with_retry(self, url, **kwargs):
         """Retry 3 times to fetch the url if there is a transport error."""
+        client = self.async_client
         for attempt in range(3):
             _LOGGER.debug(
-                "HTTP GET Attempt #%s: %s: Header:%s Cookies:%s",
+                "HTTP GET Attempt #%s: %s: Header:%s",
                 attempt + 1,
                 url,
                 self._authorization_header,
-                self._cookies,
             )
+            sent_at = time.monotonic()
             try:
-                async with self.async_client as client:
-                    resp = await client.get(
-                        url,
-                        headers=self._authorization_header,
-                        cookies=self._cookies,
-                        timeout=30,
-                        **kwargs,
+                resp = await client.get(
+                    url,
+                    headers=self._authorization_header,
+                    timeout=30,
+                    **kwargs,
+                )
+                if resp.status_code == 401 and attempt < 2:
+                    _LOGGER.debug(
+                        "Received 401 from Envoy; refreshing token, attempt %s of 2",
+                        attempt + 1,
                     )
-                    if resp.status_code == 401 and attempt < 2:
-                        _LOGGER.debug(
-                            "Received 401 from Envoy; refreshing token, attempt %s of 2",
-                            attempt + 1,
-                        )
-                        could_refresh_cookies = await self._refresh_token_cookies()
-                        if not could_refresh_cookies:
-                            await self._getEnphaseToken()
-                        continue
+                    await self._refresh_token_after_401(sent_at)
+                    continue
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug("Fetched from %s: %s: %s", url, resp, resp.text)
-                    if resp.status_code == 404:
-                        return None
-                    return resp
+                if resp.status_code == 404:
+                    return None
+                return resp
             except httpx.TransportError as e:
                 _LOGGER.debug("TransportError: %s", e)
                 if attempt == 2:
                     raise e
+                # back off before retrying so a struggling Envoy gets some rest
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+
+    async def _refresh_token_after_401(self, sent_at):
+        """Refresh the token once for all requests that got a 401 together."""
+        async with self._token_refresh_lock:
+            if self._token_refreshed_at > sent_at:
+                # another request refreshed it after this one was sent
+                return
+            could_refresh_cookies = await self._refresh_token_cookies()
+            if not could_refresh_cookies:
+                await self._getEnphaseToken()
+            self._token_refreshed_at = time.monotonic()
 
     async def _async_post(self, url, data=None, **kwargs):
         _LOGGER.debug("HTTP POST Attempt: %s", url)
         _LOGGER.debug("HTTP POST Data: %s", data)
         try:
-            async with self.async_client as client:
-                resp = await client.post(
-                    url,
-                    headers=self._authorization_header,
-                    cookies=self._cookies,
-                    data=data,
-                    timeout=30,
-                    **kwargs,
-                )
+            client = self.async_client
+            resp = await client.post(
+                url,
+                headers=self._authorization_header,
+                data=data,
+                timeout=30,
+                **kwargs,
+            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("HTTP POST %s: %s: %s", url, resp, resp.text)
-                _LOGGER.debug("HTTP POST Cookie: %s", resp.cookies)
-                return resp
+            _LOGGER.debug("HTTP POST Cookie: %s", resp.cookies)
+            return resp
         except httpx.TransportError:
             raise
 
@@ -215,17 +434,17 @@ class EnvoyReader:
         )
         _LOGGER.debug("HTTP PUT Data: %s", data)
         try:
-            async with self.async_client as client:
-                resp = await client.put(
-                    url,
-                    headers=self._authorization_header,
-                    cookies=self._cookies,
-                    json=data,
-                    timeout=60,
-                    **kwargs,
-                )
+            client = self.async_client
+            resp = await client.put(
+                url,
+                headers=self._authorization_header,
+                json=data,
+                timeout=60,
+                **kwargs,
+            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("HTTP PUT %s: %s: %s", url, resp, resp.text)
-                return resp
+            return resp
         except httpx.TransportError:
             raise
 
@@ -234,35 +453,43 @@ class EnvoyReader:
         Try to fetch the owner token json from Enlighten API
         :return:
         """
-        async with self.async_client as client:
-            # login to Enlighten
-            payload_login = {
-                "user[email]": self.enlighten_user,
-                "user[password]": self.enlighten_pass,
-            }
-            resp = await client.post(ENLIGHTEN_AUTH_URL, data=payload_login, timeout=30)
-            if resp.status_code >= 400:
-                raise Exception("Could not Authenticate via Enlighten")
-
-            # now that we're in a logged in session, we can request the installer token
-            login_data = resp.json()
-            payload_token = {
-                "session_id": login_data["session_id"],
-                "serial_num": self.enlighten_serial_num,
-                "username": self.enlighten_user,
-            }
-            resp = await client.post(
-                ENLIGHTEN_TOKEN_URL, json=payload_token, timeout=30
-            )
-            if resp.status_code != 200:
-                raise Exception("Could not get installer token")
-            return resp.text
+        client = self.async_client
+        # login to Enlighten
+        payload_login = {
+            "user[email]": self.enlighten_user,
+            "user[password]": self.enlighten_pass,
+        }
+        resp = await client.post(ENLIGHTEN_AUTH_URL, data=payload_login, timeout=30)
+        if resp.status_code >= 400:
+            raise Exception("Could not Authenticate via Enlighten")
+
+        # now that we're in a logged in session, we can request the installer token
+        login_data = resp.json()
+        payload_token = {
+            "session_id": login_data["session_id"],
+            "serial_num": self.enlighten_serial_num,
+            "username": self.enlighten_user,
+        }
+        resp = await client.post(
+            ENLIGHTEN_TOKEN_URL, json=payload_token, timeout=30
+        )
+        if resp.status_code != 200:
+            raise Exception("Could not get installer token")
+        return resp.text
 
     async def _getEnphaseToken(self):
         self._token = await self._fetch_owner_token_json()
-        _LOGGER.debug("Commissioned Token")
+        self._token_exp = jwt.decode(
+            self._token, options={"verify_signature": False}, algorithms="ES256"
+        )["exp"]
+        # allow a buffer so we can try and grab it sooner
+        self._token_refresh_at = self._token_exp - self.token_refresh_buffer_seconds
+        _LOGGER.debug(
+            "Commissioned Token, expires at: %s",
+            datetime.datetime.fromtimestamp(self._token_exp),
+        )
 
-        if self._is_enphase_token_expired(self._token):
+        if time.time() >= self._token_refresh_at:
             raise Exception("Just received token already expired")
 
         await self._refresh_token_cookies()
@@ -276,87 +503,78 @@ class EnvoyReader:
         self._authorization_header = {"Authorization": "Bearer " + self._token}
 
         # Fetch the Enphase Token status from the local Envoy
-        token_validation = await self._async_post(
-            ENDPOINT_URL_CHECK_JWT.format(self.host)
-        )
+        token_validation = await self._async_post(self._urls["check_jwt"])
 
         if token_validation.status_code == 200:
-            # set the cookies for future clients
-            self._cookies = token_validation.cookies
+            # the client's cookie jar keeps the session cookie it just got
+            # from the Envoy and sends it along with the next requests
             return True
 
         # token not valid if we get here
         return False
 
-    def _is_enphase_token_expired(self, token):
-        decode = jwt.decode(
-            token, options={"verify_signature": False}, algorithms="ES256"
-        )
-        exp_epoch = decode["exp"]
-        # allow a buffer so we can try and grab it sooner
-        exp_epoch -= self.token_refresh_buffer_seconds
-        exp_time = datetime.datetime.fromtimestamp(exp_epoch)
-        if datetime.datetime.now() < exp_time:
-            _LOGGER.debug("Token expires at: %s", exp_time)
-            return False
-        else:
-            _LOGGER.debug("Token expired on: %s", exp_time)
-            return True
-
-    async def check_connection(self):
-        """Check if the Envoy is reachable. Also check if HTTP or"""
-        """HTTPS is needed."""
-        _LOGGER.debug("Checking Host: %s", self.host)
-        resp = await self._async_fetch_with_retry(
-            ENDPOINT_URL_PRODUCTION_V1.format(self.host)
-        )
-        _LOGGER.debug("Check connection HTTP Code: %s", resp.status_code)
-        if resp.status_code == 301:
-            raise SwitchToHTTPS
-
     async def getData(self, getInverters=True):
         """Fetch data from the endpoint and if inverters selected default"""
         """to fetching inverter data."""
 
-        _LOGGER.debug("Checking Token value: %s", self._token)
-        # Check if a token has already been retrieved
-        if self._token == "":
-            _LOGGER.debug("Found empty token: %s", self._token)
+        # Fetch a token when there is none yet or it is due for a refresh
+        if not self._token or time.time() >= self._token_refresh_at:
+            _LOGGER.debug("Missing or expired token - Retrieving new token")
             await self._getEnphaseToken()
-        else:
-            _LOGGER.debug("Token is populated: %s", self._token)
-            if self._is_enphase_token_expired(self._token):
-                _LOGGER.debug("Found Expired token - Retrieving new token")
-                await self._getEnphaseToken()
 
-        if not self.endpoint_type:
-            await self.detect_model()
-        else:
-            await self._update()
+        fetch_inverters = self.get_inverters and getInverters
+        inverters_url = self._urls["endpoint_production_inverters"]
 
-        if not self.get_inverters or not getInverters:
+        # Fetch the inverters alongside the other endpoints; a failure in
+        # either one cancels the other
+        try:
+            async with asyncio.TaskGroup() as group:
+                if not self.endpoint_type:
+                    group.create_task(self.detect_model())
+                else:
+                    group.create_task(self._update())
+                if fetch_inverters:
+                    inverters = group.create_task(
+                        self._async_fetch_with_retry(inverters_url)
+                    )
+        except ExceptionGroup as err:
+            # Callers handle the httpx and RuntimeError exceptions directly,
+            # so raise the first failure and log any others
+            for other in err.exceptions[1:]:
+                _LOGGER.warning("Envoy update also failed: %r", other)
+            raise err.exceptions[0]
+
+        if not fetch_inverters:
             return
 
-        inverters_url = ENDPOINT_URL_PRODUCTION_INVERTERS.format(self.host)
-        response = await self._async_fetch_with_retry(inverters_url)
-        _LOGGER.debug(
-            "Fetched from %s: %s: %s",
-            inverters_url,
-            response,
-            response.text,
-        )
+        response = inverters.result()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Fetched from %s: %s: %s", inverters_url, response, response.text
+            )
         if response.status_code == 401:
             response.raise_for_status()
         self.endpoint_production_inverters = response
+        self._json_cache.pop("endpoint_production_inverters", None)
         return
 
-    async def detect_model(self):
-        """Method to determine if the Envoy supports consumption values or only production."""
+    async def _probe(self, update):
+        """Await an endpoint update, ignoring connection errors while probing."""
         try:
-            await self._update_from_pc_endpoint()
+            await update
         except httpx.HTTPError:
             pass
 
+    async def detect_model(self):
+        """Method to determine if the Envoy supports consumption values or only production."""
+        # production.json alone tells the model apart, fetch it alongside the
+        # endpoints every model needs
+        await asyncio.gather(
+            self._probe(self._update_endpoint("endpoint_production_json_results")),
+            self._update_from_installer_endpoint(),
+            self._update_device_info(),
+        )
+
         # If self.endpoint_production_json_results.status_code is set with
         # 401 then we will give an error
         if (
@@ -373,21 +591,20 @@ class EnvoyReader:
             self.endpoint_production_json_results
             and self.endpoint_production_json_results.status_code == 200
             and has_production_and_consumption(
-                self.endpoint_production_json_results.json()
+                self._endpoint_json("endpoint_production_json_results")
             )
         ):
             self.isMeteringEnabled = has_metering_setup(
-                self.endpoint_production_json_results.json()
+                self._endpoint_json("endpoint_production_json_results")
             )
+            updates = [self._probe(self._update_pc_details())]
             if not self.isMeteringEnabled:
-                await self._update_from_p_endpoint()
+                updates.append(self._update_from_p_endpoint())
+            await asyncio.gather(*updates)
             self.endpoint_type = ENVOY_MODEL_S
 
         if not self.endpoint_type:
-            try:
-                await self._update_from_p_endpoint()
-            except httpx.HTTPError:
-                pass
+            await self._probe(self._update_from_p_endpoint())
             if (
                 self.endpoint_production_v1_results
                 and self.endpoint_production_v1_results.status_code == 200
@@ -402,25 +619,16 @@ class EnvoyReader:
                 + "'."
             )
 
-        await self._update_from_installer_endpoint()
-        await self._update_endpoint("endpoint_info_results", ENDPOINT_URL_INFO_XML)
-        await self._update_endpoint(
-            "endpoint_inventory_results", ENDPOINT_URL_INVENTORY
-        )
-
     async def get_full_serial_number(self):
         """Method to get the  Envoy serial number."""
         response = await self._async_fetch_with_retry(
-            f"https://{self.host}/info.xml",
+            self._urls["endpoint_info_results"],
             follow_redirects=True,
         )
-        if not response.text:
-            return None
-        if "<sn>" in response.text:
-            return response.text.split("<sn>")[1].split("</sn>")[0]
-        match = SERIAL_REGEX.search(response.text)
+        content = response.content
+        match = SERIAL_XML_REGEX.search(content) or SERIAL_REGEX.search(content)
         if match:
-            return match.group(1)
+            return match.group(1).decode()
 
     def create_connect_errormessage(self):
         """Create error message if unable to connect to Envoy"""
@@ -441,360 +649,232 @@ class EnvoyReader:
             + "support the requested metric."
         )
 
+    def snapshot(self):
+        """Return the production and consumption values of the last update.
+
+        The stored production responses are decoded and traversed once per
+        update. Values that cannot be read are left out, per phase values
+        default to None."""
+        if self._snapshot is None:
+            self._snapshot = self._read_snapshot()
+        return self._snapshot
+
+    def _read_snapshot(self):
+        """Read all production and consumption values into one dict."""
+        values = dict.fromkeys(PHASE_INDEX)
+        is_model_s = self.endpoint_type == ENVOY_MODEL_S
+        metered = is_model_s and self.isMeteringEnabled
+        if is_model_s:
+            meter = self._stored_json(
+                "endpoint_production_json_results", "production", 1 if metered else 0
+            )
+            # Without metering only the current power is read from production.json
+            fields = METER_FIELDS if metered else METER_FIELDS[:1]
+            for prefix, field, _ in fields:
+                _read_meter(values, f"{prefix}production", meter, field)
+        if self.endpoint_type == ENVOY_MODEL_C or (is_model_s and not metered):
+            totals = self._stored_json("endpoint_production_v1_results")
+            fields = METER_FIELDS[1:] if is_model_s else METER_FIELDS
+            for prefix, _, field in fields:
+                _read_meter(values, f"{prefix}production", totals, field)
+        if self.endpoint_type != ENVOY_MODEL_C:
+            meter = self._stored_json(
+                "endpoint_production_json_results", "consumption", 0
+            )
+            for prefix, field, _ in METER_FIELDS:
+                _read_meter(values, f"{prefix}consumption", meter, field)
+        return values
+
+    def _stored_json(self, attr, *path):
+        """Return part of a stored endpoint's JSON, or {} if it is unavailable."""
+        try:
+            value = self._endpoint_json(attr)
+            for key in path:
+                value = value[key]
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+            return {}
+        return value
+
     async def production(self):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-
-        if self.endpoint_type == ENVOY_MODEL_S:
-            raw_json = self.endpoint_production_json_results.json()
-            idx = 1 if self.isMeteringEnabled else 0
-            production = raw_json["production"][idx]["wNow"]
-        elif self.endpoint_type == ENVOY_MODEL_C:
-            raw_json = self.endpoint_production_v1_results.json()
-            production = raw_json["wattsNow"]
-        return int(production)
+        return self.snapshot().get("production")
 
     async def production_phase(self, phase):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-        phase_map = {"production_l1": 0, "production_l2": 1, "production_l3": 2}
-
-        if self.endpoint_type == ENVOY_MODEL_S:
-            raw_json = self.endpoint_production_json_results.json()
-            idx = 1 if self.isMeteringEnabled else 0
-            try:
-                return int(
-                    raw_json["production"][idx]["lines"][phase_map[phase]]["wNow"]
-                )
-            except (KeyError, IndexError):
-                return None
-
-        return None
+        return self.snapshot()[phase]
 
     async def consumption(self):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-
-        """Only return data if Envoy supports Consumption"""
-        if self.endpoint_type in ENVOY_MODEL_C:
-            return self.message_consumption_not_available
-
-        raw_json = self.endpoint_production_json_results.json()
-        consumption = raw_json["consumption"][0]["wNow"]
-        return int(consumption)
+        return self.snapshot().get("consumption")
 
     async def consumption_phase(self, phase):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-        phase_map = {"consumption_l1": 0, "consumption_l2": 1, "consumption_l3": 2}
-
-        """Only return data if Envoy supports Consumption"""
-        if self.endpoint_type in ENVOY_MODEL_C:
-            return None
-
-        raw_json = self.endpoint_production_json_results.json()
-        try:
-            return int(raw_json["consumption"][0]["lines"][phase_map[phase]]["wNow"])
-        except (KeyError, IndexError):
-            return None
+        return self.snapshot()[phase]
 
     async def daily_production(self):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-
-        if self.endpoint_type == ENVOY_MODEL_S and self.isMeteringEnabled:
-            raw_json = self.endpoint_production_json_results.json()
-            daily_production = raw_json["production"][1]["whToday"]
-        elif self.endpoint_type == ENVOY_MODEL_C or (
-            self.endpoint_type == ENVOY_MODEL_S and not self.isMeteringEnabled
-        ):
-            raw_json = self.endpoint_production_v1_results.json()
-            daily_production = raw_json["wattHoursToday"]
-        return int(daily_production)
+        return self.snapshot().get("daily_production")
 
     async def daily_production_phase(self, phase):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-        phase_map = {
-            "daily_production_l1": 0,
-            "daily_production_l2": 1,
-            "daily_production_l3": 2,
-        }
-
-        if self.endpoint_type == ENVOY_MODEL_S and self.isMeteringEnabled:
-            raw_json = self.endpoint_production_json_results.json()
-            idx = 1 if self.isMeteringEnabled else 0
-            try:
-                return int(
-                    raw_json["production"][idx]["lines"][phase_map[phase]]["whToday"]
-                )
-            except (KeyError, IndexError):
-                return None
-
-        return None
+        return self.snapshot()[phase]
 
     async def daily_consumption(self):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-
-        """Only return data if Envoy supports Consumption"""
-        if self.endpoint_type in ENVOY_MODEL_C:
-            return self.message_consumption_not_available
-
-        raw_json = self.endpoint_production_json_results.json()
-        daily_consumption = raw_json["consumption"][0]["whToday"]
-        return int(daily_consumption)
+        return self.snapshot().get("daily_consumption")
 
     async def daily_consumption_phase(self, phase):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-        phase_map = {
-            "daily_consumption_l1": 0,
-            "daily_consumption_l2": 1,
-            "daily_consumption_l3": 2,
-        }
-
-        """Only return data if Envoy supports Consumption"""
-        if self.endpoint_type in ENVOY_MODEL_C:
-            return None
-
-        raw_json = self.endpoint_production_json_results.json()
-        try:
-            return int(raw_json["consumption"][0]["lines"][0]["whToday"])
-        except (KeyError, IndexError):
-            return None
+        return self.snapshot()[phase]
 
     async def seven_days_production(self):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-
-        if self.endpoint_type == ENVOY_MODEL_S and self.isMeteringEnabled:
-            raw_json = self.endpoint_production_json_results.json()
-            seven_days_production = raw_json["production"][1]["whLastSevenDays"]
-        elif self.endpoint_type == ENVOY_MODEL_C or (
-            self.endpoint_type == ENVOY_MODEL_S and not self.isMeteringEnabled
-        ):
-            raw_json = self.endpoint_production_v1_results.json()
-            seven_days_production = raw_json["wattHoursSevenDays"]
-        return int(seven_days_production)
+        return self.snapshot().get("seven_days_production")
 
     async def seven_days_consumption(self):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-
-        """Only return data if Envoy supports Consumption"""
-        if self.endpoint_type in ENVOY_MODEL_C:
-            return self.message_consumption_not_available
-
-        raw_json = self.endpoint_production_json_results.json()
-        seven_days_consumption = raw_json["consumption"][0]["whLastSevenDays"]
-        return int(seven_days_consumption)
+        return self.snapshot().get("seven_days_consumption")
 
     async def lifetime_production(self):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-
-        if self.endpoint_type == ENVOY_MODEL_S and self.isMeteringEnabled:
-            raw_json = self.endpoint_production_json_results.json()
-            lifetime_production = raw_json["production"][1]["whLifetime"]
-        elif self.endpoint_type == ENVOY_MODEL_C or (
-            self.endpoint_type == ENVOY_MODEL_S and not self.isMeteringEnabled
-        ):
-            raw_json = self.endpoint_production_v1_results.json()
-            lifetime_production = raw_json["wattHoursLifetime"]
-        return int(lifetime_production)
+        return self.snapshot().get("lifetime_production")
 
     async def lifetime_production_phase(self, phase):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-        phase_map = {
-            "lifetime_production_l1": 0,
-            "lifetime_production_l2": 1,
-            "lifetime_production_l3": 2,
-        }
-
-        if self.endpoint_type == ENVOY_MODEL_S and self.isMeteringEnabled:
-            raw_json = self.endpoint_production_json_results.json()
-            idx = 1 if self.isMeteringEnabled else 0
-
-            try:
-                return int(
-                    raw_json["production"][idx]["lines"][phase_map[phase]]["whLifetime"]
-                )
-            except (KeyError, IndexError):
-                return None
-
-        return None
+        return self.snapshot()[phase]
 
     async def lifetime_consumption(self):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-
-        """Only return data if Envoy supports Consumption"""
-        if self.endpoint_type in ENVOY_MODEL_C:
-            return self.message_consumption_not_available
-
-        raw_json = self.endpoint_production_json_results.json()
-        lifetime_consumption = raw_json["consumption"][0]["whLifetime"]
-        return int(lifetime_consumption)
+        return self.snapshot().get("lifetime_consumption")
 
     async def lifetime_consumption_phase(self, phase):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
-        phase_map = {
-            "lifetime_consumption_l1": 0,
-            "lifetime_consumption_l2": 1,
-            "lifetime_consumption_l3": 2,
-        }
-
-        """Only return data if Envoy supports Consumption"""
-        if self.endpoint_type in ENVOY_MODEL_C:
-            return None
-
-        raw_json = self.endpoint_production_json_results.json()
-        try:
-            return int(
-                raw_json["consumption"][0]["lines"][phase_map[phase]]["whLifetime"]
-            )
-        except (KeyError, IndexError):
-            return None
+        return self.snapshot()[phase]
 
     async def inverters_production(self):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
 
-        response_dict = {}
         try:
-            for item in self.endpoint_production_inverters.json():
-                response_dict[item["serialNumber"]] = {
+            return {
+                item["serialNumber"]: {
                     "watt": item["lastReportWatts"],
-                    "report_date": time.strftime(
-                        "%Y-%m-%d %H:%M:%S", time.localtime(item["lastReportDate"])
-                    ),
+                    "report_date": _report_date(item["lastReportDate"]),
                 }
+                for item in self._endpoint_json("endpoint_production_inverters")
+            }
         except (JSONDecodeError, KeyError, IndexError, TypeError, AttributeError):
             return None
 
-        return response_dict
-
     async def production_power(self):
         """Return production power status reported by Envoy"""
         if self.endpoint_production_power is not None:
-            power_json = self.endpoint_production_power.json()
-            if "powerForcedOff" in power_json.keys():
+            power_json = self._endpoint_json("endpoint_production_power")
+            if "powerForcedOff" in power_json:
                 return not power_json["powerForcedOff"]
 
         return None
 
     async def set_production_power(self, power_on):
         if self.endpoint_production_power is not None:
-            formatted_url = ENDPOINT_URL_PRODUCTION_POWER.format(self.host)
             power_forced_off = 0 if power_on else 1
             result = await self._async_put(
-                formatted_url, data={"length": 1, "arr": [power_forced_off]}
+                self._urls["endpoint_production_power"],
+                data={"length": 1, "arr": [power_forced_off]},
             )
 
-    async def inverters_status(self):
-        """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
-        """so that this method will only read data from stored variables"""
-        response_dict = {}
-        try:
-            devstatus = self.endpoint_devstatus.json()
-            for item in devstatus["pcu"]["values"]:
-                if "serialNumber" in devstatus["pcu"]["fields"]:
-                    if (
-                        item[devstatus["pcu"]["fields"].index("devType")] == 12
-                    ):  # this is a relay
-                        continue
-
-                    serial = item[devstatus["pcu"]["fields"].index("serialNumber")]
-
-                    response_dict[serial] = {}
-
-                    for field in [
-                        "communicating",
-                        "producing",
-                        "reportDate",
-                        "temperature",
-                        "dcVoltageINmV",
-                        "dcCurrentINmA",
-                        "acVoltageINmV",
-                        "acPowerINmW",
-                    ]:
-                        if field in devstatus["pcu"]["fields"]:
-                            value = item[devstatus["pcu"]["fields"].index(field)]
-                            if field == "reportDate":
-                                response_dict[serial]["report_date"] = time.strftime(
-                                    "%Y-%m-%d %H:%M:%S", time.localtime(value)
-                                )
-                            elif field == "dcVoltageINmV":
-                                response_dict[serial]["dc_voltage"] = int(value) / 1000
-                            elif field == "dcCurrentINmA":
-                                response_dict[serial]["dc_current"] = int(value) / 1000
-                            elif field == "acVoltageINmV":
-                                response_dict[serial]["ac_voltage"] = int(value) / 1000
-                            elif field == "acPowerINmW":
-                                response_dict[serial]["ac_power"] = int(value) / 1000
-                            else:
-                                response_dict[serial][field] = value
+    def _parse_pcu(self):
+        """Split the devstatus pcu table into inverter and relay status.
 
+        The table is walked once per fetched devstatus response. Returns None
+        when the table cannot be read."""
+        response = self.endpoint_devstatus
+        if self._pcu_status is not None and self._pcu_status[0] is response:
+            return self._pcu_status[1]
+
+        try:
+            pcu = self._endpoint_json("endpoint_devstatus")["pcu"]
+            pcu_idx = _field_index(pcu)
+            rows = pcu["values"]
         except (JSONDecodeError, KeyError, IndexError, TypeError, AttributeError):
-            return None
+            parsed = None
+        else:
+            inverters = {}
+            relays = {}
+            if "serialNumber" in pcu_idx and "devType" in pcu_idx:
+                serial_i = pcu_idx["serialNumber"]
+                devtype_i = pcu_idx["devType"]
+                width = len(pcu_idx)
+                read_inverter = _row_reader(pcu_idx, INVERTER_PCU_FIELDS)
+                read_relay = _row_reader(pcu_idx, RELAY_PCU_FIELDS)
+                for item in rows:
+                    if not isinstance(item, list) or len(item) < width:
+                        continue  # skip malformed rows
+                    try:
+                        if item[devtype_i] == 12:  # this is a relay
+                            relays[item[serial_i]] = read_relay(item)
+                        else:
+                            inverters[item[serial_i]] = read_inverter(item)
+                    except ROW_ERRORS:
+                        _LOGGER.debug("Skipping unreadable devstatus row: %s", item)
+            parsed = (inverters, relays)
+
+        self._pcu_status = (response, parsed)
+        return parsed
 
-        return response_dict
+    async def inverters_status(self):
+        """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
+        """so that this method will only read data from stored variables"""
+        pcu_status = self._parse_pcu()
+        return None if pcu_status is None else pcu_status[0]
 
     async def relay_status(self):
         """Return relay status from Envoys that have relays installed."""
-        response_dict = {}
+        pcu_status = self._parse_pcu()
+        if pcu_status is None:
+            return None
         try:
-            devstatus = self.endpoint_devstatus.json()
-            for item in devstatus["pcu"]["values"]:
-                if "serialNumber" in devstatus["pcu"]["fields"]:
-                    if (
-                        item[devstatus["pcu"]["fields"].index("devType")] != 12
-                    ):  # this is a relay
-                        continue
-
-                    serial = item[devstatus["pcu"]["fields"].index("serialNumber")]
-                    dev = response_dict.setdefault(serial, {})
-                    for field in [
-                        "communicating",
-                        "reportDate",
-                    ]:
-                        if field in devstatus["pcu"]["fields"]:
-                            value = item[devstatus["pcu"]["fields"].index(field)]
-                            if field == "reportDate":
-                                dev["report_date"] = time.strftime(
-                                    "%Y-%m-%d %H:%M:%S", time.localtime(value)
-                                )
-                            else:
-                                dev[field] = value
-
-            for item in devstatus["nsrb"]["values"]:
-                if "serialNumber" in devstatus["nsrb"]["fields"]:
-                    serial = item[devstatus["nsrb"]["fields"].index("serialNumber")]
-                    response_dict[serial] = {}
-                    dev = response_dict.setdefault(serial, {})
-
-                    for field in [
-                        "relay",
-                        "forced",
-                        "reason_code",
-                        "reason",
-                    ]:
-                        if field in devstatus["nsrb"]["fields"]:
-                            value = item[devstatus["nsrb"]["fields"].index(field)]
-                            dev[field] = value
+            nsrb = self._endpoint_json("endpoint_devstatus")["nsrb"]
+            nsrb_idx = _field_index(nsrb)
+            nsrb_rows = nsrb["values"]
         except (JSONDecodeError, KeyError, IndexError, TypeError, AttributeError):
             return None
 
-        return response_dict
+        # copy the cached pcu status before the nsrb fields are merged in
+        response_dict = {serial: dict(dev) for serial, dev in pcu_status[1].items()}
+        if "serialNumber" in nsrb_idx:
+            serial_i = nsrb_idx["serialNumber"]
+            width = len(nsrb_idx)
+            read_row = _row_reader(nsrb_idx, RELAY_NSRB_FIELDS)
+            for item in nsrb_rows:
+                if not isinstance(item, list) or len(item) < width:
+                    continue  # skip malformed rows
+                try:
+                    values = read_row(item)
+                    # add to the relay's pcu status instead of replacing it
+                    response_dict.setdefault(item[serial_i], {}).update(values)
+                except ROW_ERRORS:
+                    _LOGGER.debug("Skipping unreadable devstatus row: %s", item)
 
-        return self.message_relay_not_installed
+        return response_dict
 
     async def firmware_data(self):
         if self.endpoint_home_json_results:
-            home_json = self.endpoint_home_json_results.json()
+            home_json = self._endpoint_json("endpoint_home_json_results")
 
             if "update_status" in home_json:
                 return {
@@ -807,7 +887,7 @@ class EnvoyReader:
         device_data = {}
 
         if self.endpoint_home_json_results:
-            home_json = self.endpoint_home_json_results.json()
+            home_json = self._endpoint_json("endpoint_home_json_results")
             if "update_status" in home_json:
                 device_data["update_status"] = home_json["update_status"]
                 device_data["software_build_epoch"] = home_json["software_build_epoch"]
@@ -825,7 +905,7 @@ class EnvoyReader:
     async def inverters_info(self):
         response_dict = {}
         try:
-            devinfo = self.endpoint_inventory_results.json()
+            devinfo = self._endpoint_json("endpoint_inventory_results")
             for item in devinfo:
                 if "type" in item and item["type"] == "PCU":
                     for device in item["devices"]:
@@ -838,17 +918,60 @@ class EnvoyReader:
 
         return response_dict
 
+    async def get_all(self):
+        """Return every value read from the stored endpoint results.
+
+        Running getData() beforehand stores the endpoint results. Values that
+        cannot be read from them are left out of the result, with a warning
+        the first time a value fails."""
+        data = {}
+        coros = chain(
+            ((key, getattr(self, method)()) for key, method in VALUE_READERS),
+            (
+                (key, getattr(self, method)(key))
+                for key, method in PHASE_VALUE_READERS
+            ),
+        )
+        for key, coro in coros:
+            try:
+                data[key] = await coro
+            except (httpx.HTTPError, ValueError, KeyError, IndexError) as err:
+                if key in self._unreadable_keys:
+                    _LOGGER.debug("Could not read %s: %s", key, err)
+                else:
+                    self._unreadable_keys.add(key)
+                    _LOGGER.warning("Could not read %s: %s", key, err)
+            else:
+                self._unreadable_keys.discard(key)
+
+        return data
+
     def run_in_console(self):
         """If running this module directly, print all the values in the console."""
         print("Reading...")
-        loop = asyncio.get_event_loop()
-        data_results = loop.run_until_complete(
-            asyncio.gather(self.getData(), return_exceptions=False)
-        )
+        asyncio.run(self._print_all())
 
-        loop = asyncio.get_event_loop()
-        results = loop.run_until_complete(
-            asyncio.gather(
+    async def _print_all(self):
+        """Fetch and print all the values, then close the client."""
+        try:
+            await self.getData()
+            (
+                production,
+                consumption,
+                daily_production,
+                daily_consumption,
+                seven_days_production,
+                seven_days_consumption,
+                lifetime_production,
+                lifetime_consumption,
+                inverters_production,
+                production_power,
+                inverters_status,
+                relays,
+                firmware_data,
+                envoy_info,
+                inverters_info,
+            ) = await asyncio.gather(
                 self.production(),
                 self.consumption(),
                 self.daily_production(),
@@ -864,27 +987,30 @@ class EnvoyReader:
                 self.firmware_data(),
                 self.envoy_info(),
                 self.inverters_info(),
-                return_exceptions=False,
             )
-        )
-
-        print(f"production:              {results[0]}")
-        print(f"consumption:             {results[1]}")
-        print(f"daily_production:        {results[2]}")
-        print(f"daily_consumption:       {results[3]}")
-        print(f"seven_days_production:   {results[4]}")
-        print(f"seven_days_consumption:  {results[5]}")
-        print(f"lifetime_production:     {results[6]}")
-        print(f"lifetime_consumption:    {results[7]}")
-        print(f"inverters_production:    {results[8]}")
-        print(f"production_power:        {results[9]}")
-        print(f"inverters_status:        {results[10]}")
-        print(f"relays:                  {results[11]}")
-        print(f"envoy_info:              {results[12]}")
-        print(f"inverters_info:          {results[13]}")
+        finally:
+            await self.aclose()
+
+        print(f"production:              {production}")
+        print(f"consumption:             {consumption}")
+        print(f"daily_production:        {daily_production}")
+        print(f"daily_consumption:       {daily_consumption}")
+        print(f"seven_days_production:   {seven_days_production}")
+        print(f"seven_days_consumption:  {seven_days_consumption}")
+        print(f"lifetime_production:     {lifetime_production}")
+        print(f"lifetime_consumption:    {lifetime_consumption}")
+        print(f"inverters_production:    {inverters_production}")
+        print(f"production_power:        {production_power}")
+        print(f"inverters_status:        {inverters_status}")
+        print(f"relays:                  {relays}")
+        print(f"firmware_data:           {firmware_data}")
+        print(f"envoy_info:              {envoy_info}")
+        print(f"inverters_info:          {inverters_info}")
 
 
 if __name__ == "__main__":
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Retrieve energy information from the Enphase Envoy device."
     )
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import datetime
+from itertools import chain
 
 from time import strftime, localtime
 
@@ -16,9 +17,11 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     COORDINATOR,
+    DEVICE_SENSORS,
     DOMAIN,
     NAME,
-    SENSORS,
+    INVERTER_SENSORS,
+    INVERTER_STATUS_SENSORS,
     ICON,
     PHASE_SENSORS,
 )
@@ -34,76 +37,54 @@ async def async_setup_entry(
     coordinator = data[COORDINATOR]
     name = data[NAME]
 
-    entities = []
-    for sensor_description in SENSORS:
-        if sensor_description.key == "inverters":
-            if coordinator.data.get("inverters_production") is not None:
-                for inverter in coordinator.data["inverters_production"]:
-                    device_name = f"Inverter {inverter}"
-                    entity_name = f"{device_name} {sensor_description.name}"
-                    serial_number = inverter
-                    entities.append(
-                        EnvoyInverterEntity(
-                            sensor_description,
-                            entity_name,
-                            device_name,
-                            serial_number,
-                            serial_number,
-                            coordinator,
-                            config_entry.unique_id,
-                        )
-                    )
-        elif sensor_description.key.startswith("inverters_"):
-            if coordinator.data.get("inverters_status") is not None:
-                for inverter in coordinator.data["inverters_status"].keys():
-                    device_name = f"Inverter {inverter}"
-                    entity_name = f"{device_name} {sensor_description.name}"
-                    serial_number = inverter
-                    entities.append(
-                        EnvoyInverterEntity(
-                            sensor_description,
-                            entity_name,
-                            device_name,
-                            serial_number,
-                            None,
-                            coordinator,
-                            config_entry.unique_id,
-                        )
-                    )
-
-        else:
-            data = coordinator.data.get(sensor_description.key)
-            if data is None:
-                continue
+    inverters_production = coordinator.data.get("inverters_production")
+    inverters_status = coordinator.data.get("inverters_status")
 
-            entity_name = f"{name} {sensor_description.name}"
-            entities.append(
-                CoordinatedEnvoyEntity(
+    entities = []
+    if inverters_production is not None:
+        for inverter in inverters_production:
+            device_name = f"Inverter {inverter}"
+            entities.extend(
+                EnvoyInverterEntity(
                     sensor_description,
-                    entity_name,
-                    name,
+                    f"{device_name} {sensor_description.name}",
+                    device_name,
+                    inverter,
+                    inverter,
+                    coordinator,
                     config_entry.unique_id,
+                )
+                for sensor_description in INVERTER_SENSORS
+            )
+
+    if inverters_status is not None:
+        for inverter in inverters_status:
+            device_name = f"Inverter {inverter}"
+            entities.extend(
+                EnvoyInverterEntity(
+                    sensor_description,
+                    f"{device_name} {sensor_description.name}",
+                    device_name,
+                    inverter,
                     None,
                     coordinator,
+                    config_entry.unique_id,
                 )
+                for sensor_description in INVERTER_STATUS_SENSORS
             )
 
-    for sensor_description in PHASE_SENSORS:
-        data = coordinator.data.get(sensor_description.key)
-        if data is None:
-            continue
-
-        entity_name = f"{name} {sensor_description.name}"
-        entities.append(
-            CoordinatedEnvoyEntity(
-                sensor_description,
-                entity_name,
-                name,
-                config_entry.unique_id,
-                None,
-                coordinator,
-            )
+    entities.extend(
+        CoordinatedEnvoyEntity(
+            sensor_description,
+            f"{name} {sensor_description.name}",
+            name,
+            config_entry.unique_id,
+            None,
+            coordinator,
         )
+        for sensor_description in chain(DEVICE_SENSORS, PHASE_SENSORS)
+        if coordinator.data.get(sensor_description.key) is not None
+    )
 
     async_add_entities(entities)
 
@@ -179,9 +160,10 @@ class CoordinatedEnvoyEntity(EnvoyEntity, CoordinatorEntity):
 
         sw_version = None
         hw_version = None
-        if self.coordinator.data.get("envoy_info"):
-            sw_version = self.coordinator.data.get("envoy_info").get("software", None)
-            hw_version = self.coordinator.data.get("envoy_info").get("pn", None)
+        envoy_info = self.coordinator.data.get("envoy_info")
+        if envoy_info:
+            sw_version = envoy_info.get("software")
+            hw_version = envoy_info.get("pn")
 
         return DeviceInfo(
             identifiers={(DOMAIN, str(self._device_serial_number))},
@@ -212,6 +194,10 @@ class EnvoyInverterEntity(CoordinatorEntity, SensorEntity):
         self._device_name = device_name
         self._device_serial_number = device_serial_number
         self._parent_device = parent_device
+        # inverters_<field> sensors read <field> from the inverter status
+        self._status_field = (
+            description.key[10:] if description.key.startswith("inverters_") else None
+        )
         CoordinatorEntity.__init__(self, coordinator)
 
     @property
@@ -235,40 +221,34 @@ class EnvoyInverterEntity(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if self.entity_description.key.startswith("inverters_"):
-            if self.coordinator.data.get("inverters_status") is not None:
-                return (
-                    self.coordinator.data.get("inverters_status")
-                    .get(self._device_serial_number)
-                    .get(self.entity_description.key[10:])
+        data = self.coordinator.data
+        if self._status_field is not None:
+            status = data.get("inverters_status")
+            if status is not None:
+                return status.get(self._device_serial_number, {}).get(
+                    self._status_field
                 )
-        elif self.coordinator.data.get("inverters_production") is not None:
-            return (
-                self.coordinator.data.get("inverters_production")
-                .get(self._device_serial_number)
-                .get("watt")
-            )
+        else:
+            production = data.get("inverters_production")
+            if production is not None:
+                return production.get(self._device_serial_number, {}).get("watt")
 
         return None
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        if self.entity_description.key.startswith("inverters_"):
-            if self.coordinator.data.get("inverters_status") is not None:
-                value = (
-                    self.coordinator.data.get("inverters_status")
-                    .get(self._device_serial_number)
-                    .get("report_date")
-                )
+        data = self.coordinator.data
+        if self._status_field is not None:
+            status = data.get("inverters_status")
+            if status is not None:
+                value = status.get(self._device_serial_number, {}).get("report_date")
+                return {"last_reported": value}
+        else:
+            production = data.get("inverters_production")
+            if production is not None:
+                value = production.get(self._serial_number, {}).get("report_date")
                 return {"last_reported": value}
-        elif self.coordinator.data.get("inverters_production") is not None:
-            value = (
-                self.coordinator.data.get("inverters_production")
-                .get(self._serial_number)
-                .get("report_date")
-            )
-            return {"last_reported": value}
 
         return None
 
@@ -280,19 +260,13 @@ class EnvoyInverterEntity(CoordinatorEntity, SensorEntity):
 
         sw_version = None
         hw_version = None
-        if self.coordinator.data.get("inverters_info") and self.coordinator.data.get(
-            "inverters_info"
-        ).get(self._device_serial_number):
-            sw_version = (
-                self.coordinator.data.get("inverters_info")
-                .get(self._device_serial_number)
-                .get("img_pnum_running")
-            )
-            hw_version = (
-                self.coordinator.data.get("inverters_info")
-                .get(self._device_serial_number)
-                .get("part_num")
-            )
+        inverters_info = self.coordinator.data.get("inverters_info")
+        inverter_info = (
+            inverters_info.get(self._device_serial_number) if inverters_info else None
+        )
+        if inverter_info:
+            sw_version = inverter_info.get("img_pnum_running")
+            hw_version = inverter_info.get("part_num")
 
         return DeviceInfo(
             identifiers={(DOMAIN, str(self._device_serial_number))},